@@ -5,12 +5,27 @@ from app.core.database import get_db
 import jwt
 import os
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id cost (OWASP: 64 MiB, 3 passes, 2 lanes); tests lower these to keep hashing fast
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "2"))
+
+# The app's only password context: new hashes use argon2, existing bcrypt hashes still verify
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__parallelism=ARGON2_PARALLELISM,
+)
 
 # JWT configuration
 SECRET_KEY = os.getenv("JWT_SECRET")
 ALGORITHM = "HS256"
 
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -1,13 +1,26 @@
 import os
+import re
 import json
 import pickle
 import logging
 import redis.asyncio as redis
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from datetime import timedelta
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib serializer
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Keep orjson output compatible with json.dumps(default=str): datetimes go through str()
+# rather than orjson's RFC 3339 format, and non-str dict keys are allowed
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+# orjson cannot write integers beyond 64 bits and reads them back as floats; any run of
+# 19+ digits might be one, so those payloads go through json instead
+LONG_DIGITS = re.compile(r"\d{19}")
+
 # Global cache instance
 cache = None
 
@@ -43,20 +56,37 @@ class RedisCache:
                 raise
         return self._redis
 
+    @staticmethod
+    def _serialize(value: Any, use_pickle: bool) -> Any:
+        if use_pickle:
+            return pickle.dumps(value)
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, default=str, option=ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(value, default=str)
+
+    @staticmethod
+    def _deserialize(value: Any, use_pickle: bool) -> Any:
+        if use_pickle:
+            return pickle.loads(value.encode('latin1'))
+        if orjson is not None and not LONG_DIGITS.search(value):
+            return orjson.loads(value)
+        return json.loads(value)
+
+    @staticmethod
+    def _expire_seconds(expire: Union[int, timedelta]) -> int:
+        if isinstance(expire, timedelta):
+            return int(expire.total_seconds())
+        return expire
+
     async def set(self, key: str, value: Any, expire: Union[int, timedelta] = 3600, use_pickle: bool = False) -> bool:
         """Set a value in cache"""
         try:
             redis_client = await self.get_redis()
-            
-            if use_pickle:
-                serialized_value = pickle.dumps(value)
-            else:
-                serialized_value = json.dumps(value, default=str)
-            
-            if isinstance(expire, timedelta):
-                expire_seconds = int(expire.total_seconds())
-            else:
-                expire_seconds = expire
+            serialized_value = self._serialize(value, use_pickle)
+            expire_seconds = self._expire_seconds(expire)
             
             await redis_client.setex(key, expire_seconds, serialized_value)
             logger.debug(f"Cache SET: {key} (expires in {expire_seconds}s)")
@@ -76,10 +106,7 @@ class RedisCache:
                 logger.debug(f"Cache MISS: {key}")
                 return None
             
-            if use_pickle:
-                deserialized_value = pickle.loads(value.encode('latin1'))
-            else:
-                deserialized_value = json.loads(value)
+            deserialized_value = self._deserialize(value, use_pickle)
             
             logger.debug(f"Cache HIT: {key}")
             return deserialized_value
@@ -88,6 +115,40 @@ class RedisCache:
             logger.error(f"Cache GET error for key {key}: {e}")
             return None
 
+    async def set_many(self, mapping: Dict[str, Any], expire: Union[int, timedelta] = 3600, use_pickle: bool = False) -> bool:
+        """Set several values in cache with one MSET and their expirations, in a single round-trip"""
+        if not mapping:
+            return True
+        try:
+            serialized = {key: self._serialize(value, use_pickle) for key, value in mapping.items()}
+            expire_seconds = self._expire_seconds(expire)
+            
+            async with await self.pipeline(transaction=True) as pipe:
+                pipe.mset(serialized)
+                for key in serialized:
+                    pipe.expire(key, expire_seconds)
+                await pipe.execute()
+            logger.debug(f"Cache SET MANY: {len(serialized)} keys (expire in {expire_seconds}s)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Cache SET MANY error for {len(mapping)} keys: {e}")
+            return False
+
+    async def get_many(self, keys: List[str], use_pickle: bool = False) -> List[Optional[Any]]:
+        """Get several values from cache with a single MGET; missing keys come back as None"""
+        if not keys:
+            return []
+        try:
+            redis_client = await self.get_redis()
+            values = await redis_client.mget(keys)
+            logger.debug(f"Cache GET MANY: {len(keys)} keys")
+            return [None if value is None else self._deserialize(value, use_pickle) for value in values]
+            
+        except Exception as e:
+            logger.error(f"Cache GET MANY error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
     async def delete(self, key: str) -> bool:
         """Delete a key from cache"""
         try:
@@ -149,6 +210,11 @@ class RedisCache:
             logger.error(f"Cache FLUSH error: {e}")
             return False
 
+    async def pipeline(self, transaction: bool = False):
+        """Get a pipeline for batching several commands into a single round-trip"""
+        redis_client = await self.get_redis()
+        return redis_client.pipeline(transaction=transaction)
+
     async def close(self):
         """Close Redis connection"""
         if self._redis:
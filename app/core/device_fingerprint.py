@@ -1,15 +1,24 @@
 import hashlib
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from user_agents import parse
 import ipaddress
 import requests
 from fastapi import Request
 
+
+@lru_cache(maxsize=4096)
+def _parse_user_agent(user_agent: str):
+    """Parse a user agent once and share the result between hashing and naming"""
+    return parse(user_agent)
+
+
 class DeviceFingerprint:
     """Utility class for device fingerprinting and validation"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def create_device_hash(user_agent: str, screen_resolution: Optional[str] = None, 
                           timezone: Optional[str] = None, language: Optional[str] = None) -> str:
         """
@@ -25,7 +34,7 @@ class DeviceFingerprint:
             SHA-256 hash of device fingerprint
         """
         # Parse user agent to extract device info
-        ua = parse(user_agent)
+        ua = _parse_user_agent(user_agent)
         
         # Create fingerprint data
         fingerprint_data = {
@@ -47,9 +56,10 @@ class DeviceFingerprint:
         return hashlib.sha256(fingerprint_json.encode()).hexdigest()
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_device_name(user_agent: str) -> str:
         """Generate a human-readable device name from user agent"""
-        ua = parse(user_agent)
+        ua = _parse_user_agent(user_agent)
         
         if ua.is_mobile:
             device_type = "Mobile"
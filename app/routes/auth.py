@@ -3,12 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from app.core.database import get_db
+from app.core.auth import pwd_context, hash_password, verify_password
 from app.core.cache import get_cache, CacheKeys, RedisCache
 from app.schemas.user import UserAuth, UserCreate, UserRead
 from pydantic import BaseModel
 from typing import List
 from app.models.user import User as UserModel, UserPreferences as UserPreferencesModel
-from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 import jwt
 import os
@@ -83,14 +83,6 @@ class ResetPasswordRequest(BaseModel):
 class TwoFactorVerificationRequest(BaseModel):
     code: str
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
 def create_access_token(data: dict, user: UserModel | None = None, expires_delta: timedelta | None = None, jti: str | None = None):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -119,17 +111,20 @@ def send_reset_email(to_email: str, reset_link: str):
         smtp.login(EMAIL_FROM, EMAIL_PASSWORD)
         smtp.send_message(msg)
 
+INVITATION_EMAIL_SUBJECT = "You're invited to join a Family Group on Spendlyzer!"
+INVITATION_EMAIL_BODY = (
+    "Hi {first_name},\n\nYou have been invited to join a family group on Spendlyzer. "
+    "Click the link below to complete your signup process:\n{signup_link}\n\nIf you did not expect this invitation, you can ignore this email."
+)
+
 def send_invitation_email(to_email: str, first_name: str, signup_token: str):
     try:
         signup_link = f"http://localhost:4200/invite-signup?token={signup_token}"
         msg = EmailMessage()
-        msg["Subject"] = "You're invited to join a Family Group on Spendlyzer!"
+        msg["Subject"] = INVITATION_EMAIL_SUBJECT
         msg["From"] = EMAIL_FROM
         msg["To"] = to_email
-        msg.set_content(
-            f"Hi {first_name},\n\nYou have been invited to join a family group on Spendlyzer. "
-            f"Click the link below to complete your signup process:\n{signup_link}\n\nIf you did not expect this invitation, you can ignore this email."
-        )
+        msg.set_content(INVITATION_EMAIL_BODY.format(first_name=first_name, signup_link=signup_link))
         if not EMAIL_FROM or not EMAIL_PASSWORD:
             print(f"Error: EMAIL_FROM or EMAIL_PASSWORD not set. Cannot send email to {to_email}")
             return
@@ -291,8 +286,15 @@ async def signin(auth: UserAuth, request: Request, db: AsyncSession = Depends(ge
     )
     user = result.scalars().first()
     
-    if not user or not verify_password(auth.password, user.password_hash):
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    verified, new_hash = pwd_context.verify_and_update(auth.password, user.password_hash)
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # Rehash legacy bcrypt (or outdated argon2) hashes while the plaintext is at hand
+        user.password_hash = new_hash  # type: ignore
+        await db.commit()
     
     # Check if 2FA is enabled
     result = await db.execute(
@@ -10,19 +10,13 @@ from app.models.invitation import Invitation
 from app.models.notification_settings import NotificationSettings as NotificationSettingsModel
 from app.models.privacy_settings import PrivacySettings as PrivacySettingsModel
 from typing import List, cast
-from passlib.context import CryptContext
 from datetime import datetime, timezone
 import secrets
 from app.services.logging_service import logging_service
-from app.core.auth import get_current_user_id
+from app.core.auth import get_current_user_id, hash_password
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
 def create_family_invitations(family_group_id: int, invitees: List[dict], db: Session):
     """Create invitation records for family members"""
     invitations = []
@@ -0,0 +1,84 @@
+import importlib
+import os
+import pkgutil
+import sys
+from pathlib import Path
+
+import pytest_asyncio
+from dotenv import dotenv_values
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+# Manual smoke script against running backend/frontend servers; run it directly, not under pytest
+collect_ignore = ["test_invite_signup_route.py"]
+
+
+def _load_env():
+    """Read the .env file once and apply it without overriding the real environment"""
+    values = dotenv_values(project_root / '.env') or dotenv_values(project_root / 'app' / '.env')
+    os.environ.update({k: v for k, v in values.items() if v is not None and k not in os.environ})
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live-smtp",
+        action="store_true",
+        default=False,
+        help="run tests that send real email through the configured SMTP account"
+    )
+
+
+def pytest_configure(config):
+    # Test modules import app.* at collection time, which reads settings at import,
+    # so the environment must be populated before collection rather than in a fixture.
+    _load_env()
+    # Minimum argon2 cost: tests only need valid hashes, not slow ones
+    os.environ.setdefault("ARGON2_TIME_COST", "1")
+    os.environ.setdefault("ARGON2_MEMORY_COST", "16")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():
+    """Provide an in-memory SQLite engine with all tables created, shared by the whole session"""
+    # Import every model module so all tables and relationships are registered on Base.metadata
+    import app.models
+    from app.models.base import Base
+    for module in pkgutil.iter_modules(app.models.__path__):
+        importlib.import_module(f"app.models.{module.name}")
+
+    # StaticPool keeps a single connection so the in-memory database outlives each session
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the sqlite driver
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_engine):
+    """Provide a database session whose changes are rolled back after each test"""
+    async with db_engine.connect() as connection:
+        transaction = await connection.begin()
+        # Commits inside the test only release a SAVEPOINT; the outer transaction is rolled back
+        session = AsyncSession(bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
@@ -8,24 +8,14 @@ import os
 import sys
 import asyncio
 import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+from unittest.mock import patch
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
-env_path = project_root / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-else:
-    # Try app directory
-    app_env_path = project_root / 'app' / '.env'
-    if app_env_path.exists():
-        load_dotenv(dotenv_path=app_env_path)
-
 # Import the email function
 from app.routes.auth import send_invitation_email
 
@@ -60,12 +50,12 @@ class TestEmailFunctionality(unittest.TestCase):
         print(f"   From: {self.email_from}")
         print(f"   Password length: {len(self.email_password)} characters")
     
-    @patch('smtplib.SMTP_SSL')
+    @patch('smtplib.SMTP_SSL', autospec=True)
     def test_send_invitation_email_mock(self, mock_smtp):
         """Test email sending with mocked SMTP"""
-        # Set up mock
-        mock_smtp_instance = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
+        # Set up mock: the `with` block receives the autospecced SMTP_SSL instance
+        mock_smtp_instance = mock_smtp.return_value
+        mock_smtp_instance.__enter__.return_value = mock_smtp_instance
         
         # Call the function
         send_invitation_email(self.test_email, self.test_first_name, self.test_token)
@@ -89,6 +79,7 @@ class TestEmailFunctionality(unittest.TestCase):
         
         print("✅ Mock email test passed")
     
+    @pytest.mark.skipif("not config.getoption('--live-smtp')", reason="live SMTP disabled (pass --live-smtp to enable)")
     def test_send_invitation_email_real(self):
         """Test actual email sending (requires valid email config)"""
         if not self.email_from or not self.email_password:
@@ -130,9 +121,9 @@ class TestEmailFunctionality(unittest.TestCase):
         for case in test_cases:
             with self.subTest(email=case["email"]):
                 # Mock SMTP to capture email content
-                with patch('smtplib.SMTP_SSL') as mock_smtp:
-                    mock_smtp_instance = MagicMock()
-                    mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
+                with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+                    mock_smtp_instance = mock_smtp.return_value
+                    mock_smtp_instance.__enter__.return_value = mock_smtp_instance
                     
                     # Send email
                     send_invitation_email(case["email"], case["first_name"], case["token"])
@@ -165,7 +156,7 @@ class TestEmailFunctionality(unittest.TestCase):
                 self.fail(f"Function should handle missing email config gracefully: {e}")
         
         # Test with SMTP error
-        with patch('smtplib.SMTP_SSL') as mock_smtp:
+        with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
             mock_smtp.side_effect = Exception("SMTP connection failed")
             
             # Should not raise exception, just log error
@@ -4,7 +4,8 @@ Test script to verify invite-signup functionality
 Tests both the backend endpoints and the frontend routing.
 """
 
-import requests
+import asyncio
+import httpx
 import sys
 from pathlib import Path
 
@@ -12,71 +13,82 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def test_backend_endpoints():
+async def test_backend_endpoints():
     """Test the backend endpoints for invitation functionality"""
     base_url = "http://localhost:8000"
     
     print("🧪 Testing Backend Endpoints")
     print("=" * 40)
     
+    # Both checks share one keep-alive client and are issued concurrently
+    async with httpx.AsyncClient(base_url=base_url, timeout=2) as client:
+        health_response, invite_response = await asyncio.gather(
+            client.get("/health"),
+            client.get("/family/invite/accept/invalid-token"),
+            return_exceptions=True
+        )
+    
     # Test 1: Health check
-    try:
-        response = requests.get(f"{base_url}/health")
-        if response.status_code == 200:
-            print("✅ Backend is running")
-        else:
-            print(f"❌ Backend health check failed: {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
+    if isinstance(health_response, httpx.ConnectError):
         print("❌ Backend is not running. Start it with: python -m uvicorn app.main:app --reload --port 8000")
         return False
+    if isinstance(health_response, Exception):
+        raise health_response
+    if health_response.status_code == 200:
+        print("✅ Backend is running")
+    else:
+        print(f"❌ Backend health check failed: {health_response.status_code}")
+        return False
     
     # Test 2: Test invitation endpoint with invalid token
-    try:
-        response = requests.get(f"{base_url}/family/invite/accept/invalid-token")
-        if response.status_code == 404:
-            print("✅ Invitation endpoint responds correctly to invalid tokens")
-        else:
-            print(f"⚠️  Unexpected response for invalid token: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Error testing invitation endpoint: {e}")
+    if isinstance(invite_response, Exception):
+        print(f"❌ Error testing invitation endpoint: {invite_response}")
         return False
+    if invite_response.status_code == 404:
+        print("✅ Invitation endpoint responds correctly to invalid tokens")
+    else:
+        print(f"⚠️  Unexpected response for invalid token: {invite_response.status_code}")
     
     return True
 
-def test_frontend_routing():
+async def test_frontend_routing():
     """Test the frontend routing for invite-signup"""
     frontend_url = "http://localhost:4200"
+    test_token = "test-token-123"
+    invite_url = f"{frontend_url}/invite-signup?token={test_token}"
     
     print("\n🧪 Testing Frontend Routing")
     print("=" * 40)
     
+    # Both checks share one keep-alive client and are issued concurrently
+    async with httpx.AsyncClient(timeout=2) as client:
+        frontend_response, invite_response = await asyncio.gather(
+            client.get(frontend_url),
+            client.get(invite_url),
+            return_exceptions=True
+        )
+    
     # Test 1: Check if frontend is running
-    try:
-        response = requests.get(frontend_url)
-        if response.status_code == 200:
-            print("✅ Frontend is running")
-        else:
-            print(f"❌ Frontend check failed: {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
+    if isinstance(frontend_response, httpx.ConnectError):
         print("❌ Frontend is not running. Start it with: npm start (in spendlyzer-frontend directory)")
         return False
+    if isinstance(frontend_response, Exception):
+        raise frontend_response
+    if frontend_response.status_code == 200:
+        print("✅ Frontend is running")
+    else:
+        print(f"❌ Frontend check failed: {frontend_response.status_code}")
+        return False
     
     # Test 2: Test invite-signup route
-    try:
-        test_token = "test-token-123"
-        invite_url = f"{frontend_url}/invite-signup?token={test_token}"
-        response = requests.get(invite_url)
-        
-        if response.status_code == 200:
-            print("✅ Invite-signup route is accessible")
-            print(f"   URL: {invite_url}")
-        else:
-            print(f"❌ Invite-signup route failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Error testing invite-signup route: {e}")
+    if isinstance(invite_response, Exception):
+        print(f"❌ Error testing invite-signup route: {invite_response}")
+        return False
+    if invite_response.status_code == 200:
+        print("✅ Invite-signup route is accessible")
+        print(f"   URL: {invite_url}")
+    else:
+        print(f"❌ Invite-signup route failed: {invite_response.status_code}")
         return False
     
     return True
@@ -97,13 +109,13 @@ def test_email_link_format():
     
     return True
 
-def main():
+async def main():
     """Run all tests"""
     print("🚀 Invite Signup Route Test")
     print("=" * 50)
     
-    backend_ok = test_backend_endpoints()
-    frontend_ok = test_frontend_routing()
+    backend_ok = await test_backend_endpoints()
+    frontend_ok = await test_frontend_routing()
     email_ok = test_email_link_format()
     
     print("\n" + "=" * 50)
@@ -122,4 +134,4 @@ def main():
             print("   - Start frontend: cd spendlyzer-frontend && npm start")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
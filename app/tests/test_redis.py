@@ -5,200 +5,242 @@ Test Redis Caching Implementation
 
 import asyncio
 import json
-from app.core.cache import RedisCache, CacheKeys
+import logging
+import os
+import statistics
+import time
+from urllib.parse import urlsplit
+import fakeredis
+import pytest
+import pytest_asyncio
+import app.core.cache as cache_module
+from app.core.cache import RedisCache, get_cache, cleanup_cache, CacheKeys
+
+logger = logging.getLogger(__name__)
+
+# Set REDIS_URL_REAL (e.g. redis://localhost:6379/0) to run against a live Redis server, e.g. when benchmarking
+REDIS_URL_REAL = os.getenv("REDIS_URL_REAL")
+USE_REAL_REDIS = bool(REDIS_URL_REAL)
+
+def use_fake_redis():
+    """Back the shared cache with an in-memory Redis so the tests need no server"""
+    cache = get_cache()
+    cache._redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+def use_real_redis(url: str):
+    """Point the shared cache at the Redis server given by url"""
+    parts = urlsplit(url)
+    db = int(parts.path.lstrip("/") or 0)
+    cache_module.cache = RedisCache(host=parts.hostname or "localhost", port=parts.port or 6379, db=db)
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def _redis_backend_under_pytest():
+    """Apply the same backend choice when collected by pytest, and reset the shared cache afterwards"""
+    if USE_REAL_REDIS:
+        use_real_redis(REDIS_URL_REAL)
+    else:
+        use_fake_redis()
+    yield
+    # Later modules in this worker must not inherit the fake (or redirected) cache
+    await cleanup_cache()
 
 async def test_redis_connection():
     """Test basic Redis connection"""
     print("🔍 Testing Redis Connection...")
     
-    try:
-        cache = RedisCache()
-        redis = await cache.get_redis()
-        await redis.ping()
-        print("✅ Redis connection successful!")
-        return True
-    except Exception as e:
-        print(f"❌ Redis connection failed: {e}")
-        return False
+    cache = get_cache()
+    redis = await cache.get_redis()
+    assert await redis.ping(), "Redis did not answer PING"
+    print("✅ Redis connection successful!")
 
 async def test_basic_caching():
     """Test basic cache operations"""
     print("\n🔍 Testing Basic Caching...")
     
-    try:
-        cache = RedisCache()
-        
-        # Test set and get
-        test_data = {"user_id": 123, "name": "John Doe", "email": "john@example.com"}
-        await cache.set("test_user", test_data, expire=60)
-        print("✅ Data set in cache")
-        
-        # Test get
-        retrieved_data = await cache.get("test_user")
-        if retrieved_data == test_data:
-            print("✅ Data retrieved from cache successfully")
-        else:
-            print("❌ Data retrieval failed")
-            return False
-        
-        # Test delete
-        await cache.delete("test_user")
-        deleted_data = await cache.get("test_user")
-        if deleted_data is None:
-            print("✅ Data deleted from cache successfully")
-        else:
-            print("❌ Data deletion failed")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Basic caching test failed: {e}")
-        return False
+    cache = get_cache()
+    
+    # Test set and get
+    test_data = {"user_id": 123, "name": "John Doe", "email": "john@example.com"}
+    assert await cache.set("basic:test_user", test_data, expire=60), "Setting data in cache failed"
+    print("✅ Data set in cache")
+    
+    # Test get
+    assert await cache.get("basic:test_user") == test_data, "Data retrieval failed"
+    print("✅ Data retrieved from cache successfully")
+    
+    # Test delete
+    await cache.delete("basic:test_user")
+    assert await cache.get("basic:test_user") is None, "Data deletion failed"
+    print("✅ Data deleted from cache successfully")
+
+    # Test integers beyond 64 bits
+    big_data = {"total": 2**70}
+    assert await cache.set("basic:big_int", big_data, expire=60), "Setting a 70-bit integer failed"
+    assert await cache.get("basic:big_int") == big_data, "70-bit integer did not round-trip"
+    await cache.delete("basic:big_int")
+    print("✅ Large integers round-trip exactly")
 
 async def test_cache_keys():
     """Test cache key generation"""
     print("\n🔍 Testing Cache Keys...")
     
-    try:
-        # Test user keys
-        user_key = CacheKeys.user(123)
-        print(f"User key: {user_key}")
-        
-        # Test user preferences key
-        prefs_key = CacheKeys.user_preferences(123)
-        print(f"User preferences key: {prefs_key}")
-        
-        # Test transaction keys
-        trans_key = CacheKeys.transactions(123)
-        print(f"Transactions key: {trans_key}")
-        
-        trans_month_key = CacheKeys.transactions(123, "2024-01")
-        print(f"Transactions by month key: {trans_month_key}")
-        
-        # Test family keys
-        family_key = CacheKeys.family_group(456)
-        print(f"Family group key: {family_key}")
-        
-        members_key = CacheKeys.family_members(456)
-        print(f"Family members key: {members_key}")
-        
-        print("✅ Cache key generation successful!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Cache key test failed: {e}")
-        return False
+    # Test user keys
+    user_key = CacheKeys.user(123)
+    logger.debug("User key: %s", user_key)
+    
+    # Test user preferences key
+    prefs_key = CacheKeys.user_preferences(123)
+    logger.debug("User preferences key: %s", prefs_key)
+    
+    # Test transaction keys
+    trans_key = CacheKeys.transactions(123)
+    logger.debug("Transactions key: %s", trans_key)
+    
+    trans_month_key = CacheKeys.transactions(123, "2024-01")
+    logger.debug("Transactions by month key: %s", trans_month_key)
+    
+    # Test family keys
+    family_key = CacheKeys.family_group(456)
+    logger.debug("Family group key: %s", family_key)
+    
+    members_key = CacheKeys.family_members(456)
+    logger.debug("Family members key: %s", members_key)
+    
+    keys = [user_key, prefs_key, trans_key, trans_month_key, family_key, members_key]
+    assert all(keys), "Empty cache key generated"
+    assert len(set(keys)) == len(keys), "Cache keys collide"
+    print("✅ Cache key generation successful!")
 
 async def test_cache_expiration():
     """Test cache expiration"""
     print("\n🔍 Testing Cache Expiration...")
     
-    try:
-        cache = RedisCache()
-        
-        # Set data with short expiration
-        test_data = {"message": "This will expire soon"}
-        await cache.set("expire_test", test_data, expire=2)  # 2 seconds
-        print("✅ Data set with 2-second expiration")
-        
-        # Check it exists
-        data = await cache.get("expire_test")
-        if data:
-            print("✅ Data exists immediately after setting")
-        else:
-            print("❌ Data not found immediately after setting")
-            return False
-        
-        # Wait for expiration
-        print("⏳ Waiting for expiration...")
-        await asyncio.sleep(3)
-        
-        # Check if expired
-        expired_data = await cache.get("expire_test")
-        if expired_data is None:
-            print("✅ Data expired successfully")
-        else:
-            print("❌ Data did not expire")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Cache expiration test failed: {e}")
-        return False
+    cache = get_cache()
+    
+    # Set data with a millisecond expiration so the test doesn't block on a full-second TTL
+    test_data = {"message": "This will expire soon"}
+    redis = await cache.get_redis()
+    await redis.set("expire:test", json.dumps(test_data), px=50)  # 50 milliseconds
+    print("✅ Data set with 50-millisecond expiration")
+    
+    # Check it exists
+    assert await cache.get("expire:test") == test_data, "Data not found immediately after setting"
+    print("✅ Data exists immediately after setting")
+    
+    # Wait for expiration
+    print("⏳ Waiting for expiration...")
+    await asyncio.sleep(0.08)
+    
+    # Check if expired
+    assert await cache.get("expire:test") is None, "Data did not expire"
+    print("✅ Data expired successfully")
 
 async def test_cache_patterns():
     """Test cache pattern operations"""
     print("\n🔍 Testing Cache Patterns...")
     
+    cache = get_cache()
+    
+    # Set multiple keys with pattern
+    await cache.set("pattern:user:123:profile", {"name": "John"}, expire=60)
+    await cache.set("pattern:user:123:preferences", {"theme": "dark"}, expire=60)
+    await cache.set("pattern:user:123:transactions", {"count": 10}, expire=60)
+    await cache.set("pattern:user:456:profile", {"name": "Jane"}, expire=60)
+    
+    print("✅ Multiple keys set with pattern")
+    
     try:
-        cache = RedisCache()
-        
-        # Set multiple keys with pattern
-        await cache.set("user:123:profile", {"name": "John"}, expire=60)
-        await cache.set("user:123:preferences", {"theme": "dark"}, expire=60)
-        await cache.set("user:123:transactions", {"count": 10}, expire=60)
-        await cache.set("user:456:profile", {"name": "Jane"}, expire=60)
-        
-        print("✅ Multiple keys set with pattern")
-        
         # Test pattern deletion
-        deleted_count = await cache.delete_pattern("user:123:*")
-        print(f"✅ Deleted {deleted_count} keys with pattern 'user:123:*'")
+        deleted_count = await cache.delete_pattern("pattern:user:123:*")
+        print(f"✅ Deleted {deleted_count} keys with pattern 'pattern:user:123:*'")
+        assert deleted_count == 3, f"Expected 3 keys deleted, got {deleted_count}"
         
         # Verify deletion
-        remaining_123 = await cache.get("user:123:profile")
-        remaining_456 = await cache.get("user:456:profile")
-        
-        if remaining_123 is None and remaining_456 is not None:
-            print("✅ Pattern deletion worked correctly")
-        else:
-            print("❌ Pattern deletion failed")
-            return False
-        
+        assert await cache.get("pattern:user:123:profile") is None, "Pattern deletion left a matching key"
+        assert await cache.get("pattern:user:456:profile") is not None, "Pattern deletion removed a non-matching key"
+        print("✅ Pattern deletion worked correctly")
+    finally:
         # Clean up
-        await cache.delete_pattern("user:*")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Cache pattern test failed: {e}")
-        return False
+        await cache.delete_pattern("pattern:user:*")
 
+async def test_bulk_caching():
+    """Test set_many/get_many"""
+    print("\n🔍 Testing Bulk Caching...")
+    
+    cache = get_cache()
+    
+    test_data = {f"bulk:test_{i}": {"id": i, "data": f"bulk_data_{i}"} for i in range(3)}
+    
+    try:
+        # Empty inputs are no-ops and must not touch Redis
+        assert await cache.set_many({}), "Setting an empty mapping failed"
+        assert await cache.get_many([]) == [], "Getting an empty key list did not return []"
+        print("✅ Empty inputs handled")
+    
+        assert await cache.set_many(test_data, expire=60), "Setting data in bulk failed"
+        print("✅ Data set in bulk")
+    
+        # Every key gets the expiration, not just the MSET
+        redis = await cache.get_redis()
+        for key in test_data:
+            assert 0 < await redis.ttl(key) <= 60, f"Expiration not applied to {key}"
+        print("✅ Expiration applied to every key")
+    
+        # Values come back in key order, with None for a missing key
+        keys = [*test_data, "bulk:missing"]
+        assert await cache.get_many(keys) == [*test_data.values(), None], "Bulk retrieval failed"
+        print("✅ Data retrieved in bulk successfully")
+    finally:
+        # Clean up
+        await cache.delete_pattern("bulk:*")
+
+@pytest.mark.skipif(not USE_REAL_REDIS, reason="timings are only meaningful against a live server (set REDIS_URL_REAL)")
 async def test_performance():
     """Test cache performance"""
     print("\n🔍 Testing Cache Performance...")
     
+    cache = get_cache()
+    
+    keys = [f"perf:test_{i}" for i in range(100)]
+    
     try:
-        cache = RedisCache()
-        
-        # Test multiple operations
-        import time
-        start_time = time.time()
-        
-        # Set 100 items
-        for i in range(100):
-            await cache.set(f"perf_test_{i}", {"id": i, "data": f"test_data_{i}"}, expire=60)
-        
-        set_time = time.time() - start_time
-        print(f"✅ Set 100 items in {set_time:.3f} seconds")
-        
-        # Get 100 items
-        start_time = time.time()
-        for i in range(100):
-            await cache.get(f"perf_test_{i}")
-        
-        get_time = time.time() - start_time
-        print(f"✅ Retrieved 100 items in {get_time:.3f} seconds")
-        
+        # Set 100 items with a single MSET round-trip
+        start_ns = time.perf_counter_ns()
+        assert await cache.set_many({key: {"id": i, "data": f"test_data_{i}"} for i, key in enumerate(keys)}, expire=60), \
+            "Setting items in cache failed"
+        
+        set_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        print(f"✅ Set 100 items in {set_ms:.3f} ms")
+        
+        # Get 100 items with a single MGET round-trip
+        start_ns = time.perf_counter_ns()
+        values = await cache.get_many(keys)
+        
+        get_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        assert all(value is not None for value in values), "Some items were missing from cache"
+        print(f"✅ Retrieved 100 items in {get_ms:.3f} ms")
+        
+        # Per-request latency distribution for single GETs
+        latencies_ns = []
+        for key in keys:
+            start_ns = time.perf_counter_ns()
+            await cache.get(key)
+            latencies_ns.append(time.perf_counter_ns() - start_ns)
+        
+        percentiles = statistics.quantiles(latencies_ns, n=100)
+        p50, p95, p99 = (percentiles[k - 1] / 1e3 for k in (50, 95, 99))
+        print(f"✅ Single GET latency: p50={p50:.1f}µs p95={p95:.1f}µs p99={p99:.1f}µs")
+    finally:
         # Clean up
-        await cache.delete_pattern("perf_test_*")
-        
+        await cache.delete_pattern("perf:test_*")
+
+async def run_test(test):
+    """Run one test for the script entry point, reporting failure instead of raising"""
+    try:
+        await test()
         return True
-        
     except Exception as e:
-        print(f"❌ Performance test failed: {e}")
+        print(f"❌ Test {test.__name__} failed: {e}")
         return False
 
 async def main():
@@ -206,26 +248,32 @@ async def main():
     print("🚀 Redis Caching Test Suite")
     print("=" * 50)
     
+    # Everything after the connection check is independent (each test uses its own
+    # key prefix), so those tests run concurrently
     tests = [
-        test_redis_connection,
         test_basic_caching,
         test_cache_keys,
         test_cache_expiration,
         test_cache_patterns,
-        test_performance
+        test_bulk_caching,
     ]
     
+    if USE_REAL_REDIS:
+        use_real_redis(REDIS_URL_REAL)
+        # Timings are only meaningful against a real server
+        tests.append(test_performance)
+    else:
+        print("ℹ️  Using in-memory fakeredis (set REDIS_URL_REAL to use a live server)")
+        use_fake_redis()
+    
     passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        try:
-            if await test():
-                passed += 1
-            else:
-                print(f"❌ Test {test.__name__} failed")
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
+    total = len(tests) + 1
+    
+    if await run_test(test_redis_connection):
+        results = await asyncio.gather(*(run_test(test) for test in tests))
+        passed += 1 + sum(results)
+    
+    await cleanup_cache()
     
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} tests passed")
@@ -9,27 +9,27 @@ from unittest.mock import Mock, patch
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
-load_dotenv()
-
-from app.core.database import get_db
 from app.models.user import User
 from app.models.trusted_device import TrustedDevice
 from app.models.two_factor_auth import TwoFactorAuth
 from app.services.trusted_device_service import trusted_device_service
 from app.core.device_fingerprint import DeviceFingerprint
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+@pytest.fixture(scope="session")
+def mock_request():
+    """Provide a request mock shared by every test that needs one"""
+    request = Mock()
+    request.headers = {"user-agent": USER_AGENT}
+    request.client.host = "127.0.0.1"
+    return request
+
 
 class TestRememberDevice:
     """Test suite for Remember Device functionality"""
     
-    @pytest.fixture
-    async def db_session(self):
-        """Provide database session for tests"""
-        async for db in get_db():
-            yield db
-            await db.close()
-    
     @pytest.fixture
     async def test_user(self, db_session):
         """Create a test user for testing"""
@@ -84,13 +84,8 @@ class TestRememberDevice:
         
         return two_factor
     
-    async def test_trusted_device_creation(self, db_session, test_user):
+    async def test_trusted_device_creation(self, db_session, test_user, mock_request):
         """Test creating a trusted device"""
-        # Mock request
-        mock_request = Mock()
-        mock_request.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        mock_request.client.host = "127.0.0.1"
-        
         # Create trusted device
         trusted_device_data = trusted_device_service.create_trusted_device(
             user_id=test_user.id,
@@ -113,13 +108,8 @@ class TestRememberDevice:
         assert trusted_device.user_id == test_user.id
         assert trusted_device.is_active is True
     
-    async def test_trusted_device_verification(self, db_session, test_user, test_2fa_settings):
+    async def test_trusted_device_verification(self, db_session, test_user, test_2fa_settings, mock_request):
         """Test verifying a trusted device"""
-        # Mock request
-        mock_request = Mock()
-        mock_request.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        mock_request.client.host = "127.0.0.1"
-        
         # Create trusted device first
         trusted_device_data = trusted_device_service.create_trusted_device(
             user_id=test_user.id,
@@ -144,13 +134,8 @@ class TestRememberDevice:
         assert verified_device is not None
         assert verified_device.id == trusted_device.id
     
-    async def test_trusted_device_expiration(self, db_session, test_user):
+    async def test_trusted_device_expiration(self, db_session, test_user, mock_request):
         """Test that expired trusted devices are not valid"""
-        # Mock request
-        mock_request = Mock()
-        mock_request.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        mock_request.client.host = "127.0.0.1"
-        
         # Create trusted device with short expiration
         trusted_device_data = trusted_device_service.create_trusted_device(
             user_id=test_user.id,
@@ -176,26 +161,29 @@ class TestRememberDevice:
     
     async def test_device_fingerprint_creation(self):
         """Test device fingerprint creation"""
-        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        
-        device_hash = DeviceFingerprint.create_device_hash(user_agent)
+        device_hash = DeviceFingerprint.create_device_hash(USER_AGENT)
         
         assert device_hash is not None
         assert len(device_hash) == 64  # SHA-256 hash length
         
-        device_name = DeviceFingerprint.get_device_name(user_agent)
+        device_name = DeviceFingerprint.get_device_name(USER_AGENT)
         
         assert device_name is not None
         assert "Desktop" in device_name
         assert "Windows" in device_name
     
-    async def test_trusted_device_cleanup(self, db_session, test_user):
+    async def test_device_fingerprint_cache(self):
+        """Test that repeated fingerprinting of the same user agent is served from cache"""
+        DeviceFingerprint.create_device_hash.cache_clear()
+        first_hash = DeviceFingerprint.create_device_hash(USER_AGENT)
+        second_hash = DeviceFingerprint.create_device_hash(USER_AGENT)
+        
+        assert first_hash == second_hash
+        assert DeviceFingerprint.create_device_hash.cache_info().hits >= 1
+    
+    async def test_trusted_device_cleanup(self, db_session, test_user, mock_request):
         """Test cleanup of expired trusted devices"""
         # Create multiple trusted devices, some expired
-        mock_request = Mock()
-        mock_request.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        mock_request.client.host = "127.0.0.1"
-        
         # Create active device
         active_device_data = trusted_device_service.create_trusted_device(
             user_id=test_user.id,
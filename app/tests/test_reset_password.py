@@ -4,7 +4,6 @@ Unit tests for reset password functionality in Spendlyzer
 Tests both forgot-password and reset-password endpoints.
 """
 
-import os
 import sys
 import pytest
 import jwt
@@ -16,69 +15,69 @@ from unittest.mock import patch, MagicMock
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import httpx
 from app.main import app
 from app.core.database import get_db
 from app.models.user import User as UserModel
-from app.routes.auth import create_reset_token, hash_password, verify_password
+from app.routes.auth import SECRET_KEY, ALGORITHM, create_reset_token, hash_password, verify_password
 
-# Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_finance.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The seed password never changes, so hash it once at import
+SEED_PASSWORD = "oldpassword123"
+_SEED_PW_HASH = hash_password(SEED_PASSWORD)
 
-def override_get_db():
-    """Override database dependency for testing"""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
 
-app.dependency_overrides[get_db] = override_get_db
+def _make_token(claims: dict, ttl: timedelta) -> str:
+    """Sign claims with the app's key, expiring ttl from now (negative for an expired token)"""
+    return jwt.encode({**claims, "exp": datetime.now(timezone.utc) + ttl}, SECRET_KEY, algorithm=ALGORITHM)
+
+@pytest.fixture
+async def seed_user_id(db_session):
+    """Seed the test user inside this test's rolled-back transaction"""
+    test_user = UserModel(
+        first_name="Test",
+        last_name="User",
+        username="testuser",
+        email="test@example.com",
+        password_hash=_SEED_PW_HASH,
+        is_primary=True,
+        created_at=datetime.now(timezone.utc)
+    )
+    db_session.add(test_user)
+    await db_session.commit()
+    return test_user.id
+
+@pytest.fixture(autouse=True)
+def override_db(db_session):
+    """Point the app at this test's session, restoring the real dependency afterwards"""
+    async def override_get_db():
+        yield db_session
+    
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
 
 class TestResetPassword:
     """Test cases for reset password functionality"""
     
+    @pytest.fixture(scope="class")
+    async def client(self):
+        """Provide one client for the whole class"""
+        # The app runs on the test loop, so the routes can await the conftest AsyncSession.
+        # App startup is skipped: these routes need neither Redis nor the logging service,
+        # and starting them here would bind the service's queues to the shared test loop.
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+            yield c
+    
     @pytest.fixture(autouse=True)
-    def setup_database(self):
-        """Setup test database and create test user"""
-        # Create tables
-        from app.models.base import Base
-        Base.metadata.create_all(bind=engine)
-        
-        # Create test user
-        db = TestingSessionLocal()
-        test_user = UserModel(
-            first_name="Test",
-            last_name="User",
-            username="testuser",
-            email="test@example.com",
-            password_hash=hash_password("oldpassword123"),
-            is_primary=True,
-            created_at=datetime.now(timezone.utc)
-        )
-        db.add(test_user)
-        db.commit()
-        db.refresh(test_user)
-        self.test_user = test_user
-        self.test_user_id = test_user.id
-        
-        yield
-        
-        # Cleanup
-        db.close()
-        # Remove test database
-        if os.path.exists("./test_finance.db"):
-            os.remove("./test_finance.db")
+    def setup_database(self, seed_user_id):
+        """Expose the seeded user"""
+        self.test_user_id = seed_user_id
     
-    def test_forgot_password_success(self):
+    @patch('app.routes.auth.send_reset_email')
+    async def test_forgot_password_success(self, mock_send_email, client):
         """Test successful forgot password request"""
-        client = TestClient(app)
-        
-        response = client.post("/auth/forgot-password", json={
+        response = await client.post("/auth/forgot-password", json={
             "email": "test@example.com"
         })
         
@@ -87,11 +86,9 @@ class TestResetPassword:
         assert "message" in data
         assert "If the email is registered" in data["message"]
     
-    def test_forgot_password_invalid_email(self):
+    async def test_forgot_password_invalid_email(self, client):
         """Test forgot password with non-existent email"""
-        client = TestClient(app)
-        
-        response = client.post("/auth/forgot-password", json={
+        response = await client.post("/auth/forgot-password", json={
             "email": "nonexistent@example.com"
         })
         
@@ -101,28 +98,24 @@ class TestResetPassword:
         assert "message" in data
         assert "If the email is registered" in data["message"]
     
-    def test_forgot_password_invalid_payload(self):
+    async def test_forgot_password_invalid_payload(self, client):
         """Test forgot password with invalid payload"""
-        client = TestClient(app)
-        
         # Missing email
-        response = client.post("/auth/forgot-password", json={})
+        response = await client.post("/auth/forgot-password", json={})
         assert response.status_code == 422
         
         # Invalid email format
-        response = client.post("/auth/forgot-password", json={
+        response = await client.post("/auth/forgot-password", json={
             "email": "invalid-email"
         })
         assert response.status_code == 422
     
-    def test_reset_password_success(self):
+    async def test_reset_password_success(self, client, db_session, seed_user_id):
         """Test successful password reset"""
-        client = TestClient(app)
-        
         # Create a valid reset token
         token = create_reset_token(self.test_user_id, "test@example.com")
         
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": token,
             "new_password": "newpassword123"
         })
@@ -133,18 +126,14 @@ class TestResetPassword:
         assert "Password reset successful" in data["message"]
         
         # Verify password was actually changed
-        db = TestingSessionLocal()
-        updated_user = db.query(UserModel).filter(UserModel.id == self.test_user_id).first()
-        db.close()
+        updated_user = await db_session.get(UserModel, seed_user_id)
         
         assert verify_password("newpassword123", updated_user.password_hash)
-        assert not verify_password("oldpassword123", updated_user.password_hash)
+        assert not verify_password(SEED_PASSWORD, updated_user.password_hash)
     
-    def test_reset_password_invalid_token(self):
+    async def test_reset_password_invalid_token(self, client):
         """Test password reset with invalid token"""
-        client = TestClient(app)
-        
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": "invalid-token",
             "new_password": "newpassword123"
         })
@@ -154,24 +143,15 @@ class TestResetPassword:
         assert "detail" in data
         assert "Invalid token" in data["detail"]
     
-    def test_reset_password_expired_token(self):
+    async def test_reset_password_expired_token(self, client):
         """Test password reset with expired token"""
-        client = TestClient(app)
-        
-        # Create an expired token (manually create one with short expiry)
-        from app.routes.auth import SECRET_KEY, ALGORITHM
-        expired_token = jwt.encode(
-            {
-                "sub": str(self.test_user_id),
-                "email": "test@example.com",
-                "reset": True,
-                "exp": datetime.now(timezone.utc) - timedelta(minutes=1)  # Expired 1 minute ago
-            },
-            SECRET_KEY,
-            algorithm=ALGORITHM
+        # Create a token that expired 1 minute ago
+        expired_token = _make_token(
+            {"sub": str(self.test_user_id), "email": "test@example.com", "reset": True},
+            timedelta(minutes=-1)
         )
         
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": expired_token,
             "new_password": "newpassword123"
         })
@@ -181,23 +161,15 @@ class TestResetPassword:
         assert "detail" in data
         assert "Reset token expired" in data["detail"]
     
-    def test_reset_password_token_without_reset_flag(self):
+    async def test_reset_password_token_without_reset_flag(self, client):
         """Test password reset with token that doesn't have reset flag"""
-        client = TestClient(app)
-        
         # Create a token without the reset flag
-        from app.routes.auth import SECRET_KEY, ALGORITHM
-        invalid_token = jwt.encode(
-            {
-                "sub": str(self.test_user_id),
-                "email": "test@example.com",
-                "exp": datetime.now(timezone.utc) + timedelta(minutes=30)
-            },
-            SECRET_KEY,
-            algorithm=ALGORITHM
+        invalid_token = _make_token(
+            {"sub": str(self.test_user_id), "email": "test@example.com"},
+            timedelta(minutes=30)
         )
         
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": invalid_token,
             "new_password": "newpassword123"
         })
@@ -207,14 +179,12 @@ class TestResetPassword:
         assert "detail" in data
         assert "Invalid token" in data["detail"]
     
-    def test_reset_password_user_not_found(self):
+    async def test_reset_password_user_not_found(self, client):
         """Test password reset with token for non-existent user"""
-        client = TestClient(app)
-        
         # Create token for non-existent user
         token = create_reset_token(99999, "nonexistent@example.com")
         
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": token,
             "new_password": "newpassword123"
         })
@@ -224,33 +194,29 @@ class TestResetPassword:
         assert "detail" in data
         assert "Invalid token" in data["detail"]
     
-    def test_reset_password_invalid_payload(self):
+    async def test_reset_password_invalid_payload(self, client):
         """Test password reset with invalid payload"""
-        client = TestClient(app)
-        
         # Missing token
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "new_password": "newpassword123"
         })
         assert response.status_code == 422
         
         # Missing new_password
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": "some-token"
         })
         assert response.status_code == 422
         
         # Empty payload
-        response = client.post("/auth/reset-password", json={})
+        response = await client.post("/auth/reset-password", json={})
         assert response.status_code == 422
     
-    def test_reset_password_short_password(self):
+    async def test_reset_password_short_password(self, client):
         """Test password reset with password that's too short"""
-        client = TestClient(app)
-        
         token = create_reset_token(self.test_user_id, "test@example.com")
         
-        response = client.post("/auth/reset-password", json={
+        response = await client.post("/auth/reset-password", json={
             "token": token,
             "new_password": "123"  # Too short
         })
@@ -260,11 +226,9 @@ class TestResetPassword:
         assert response.status_code == 200
     
     @patch('app.routes.auth.send_reset_email')
-    def test_forgot_password_sends_email(self, mock_send_email):
+    async def test_forgot_password_sends_email(self, mock_send_email, client):
         """Test that forgot password actually sends an email"""
-        client = TestClient(app)
-        
-        response = client.post("/auth/forgot-password", json={
+        response = await client.post("/auth/forgot-password", json={
             "email": "test@example.com"
         })
         
@@ -281,7 +245,6 @@ class TestResetPassword:
         token = create_reset_token(self.test_user_id, "test@example.com")
         
         # Decode and verify token
-        from app.routes.auth import SECRET_KEY, ALGORITHM
         decoded = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         
         assert decoded["sub"] == str(self.test_user_id)
@@ -289,54 +252,24 @@ class TestResetPassword:
         assert decoded["reset"] is True
         assert "exp" in decoded
     
-    def test_reset_password_flow_integration(self):
+    async def test_reset_password_flow_integration(self, client, db_session, seed_user_id):
         """Test complete reset password flow"""
-        client = TestClient(app)
-        
-        # Step 1: Request password reset
-        response = client.post("/auth/forgot-password", json={
-            "email": "test@example.com"
-        })
-        assert response.status_code == 200
-        
-        # Step 2: Create reset token (simulating email link)
+        # The forgot-password request is covered by test_forgot_password_sends_email
+        # Step 1: Create reset token (simulating email link)
         token = create_reset_token(self.test_user_id, "test@example.com")
         
-        # Step 3: Reset password
-        response = client.post("/auth/reset-password", json={
+        # Step 2: Reset password
+        response = await client.post("/auth/reset-password", json={
             "token": token,
             "new_password": "newsecurepassword456"
         })
         assert response.status_code == 200
         
-        # Step 4: Verify password was changed
-        db = TestingSessionLocal()
-        updated_user = db.query(UserModel).filter(UserModel.id == self.test_user_id).first()
-        db.close()
+        # Step 3: Verify password was changed
+        updated_user = await db_session.get(UserModel, seed_user_id)
         
         assert verify_password("newsecurepassword456", updated_user.password_hash)
-        assert not verify_password("oldpassword123", updated_user.password_hash)
-
-def run_reset_password_tests():
-    """Run all reset password tests"""
-    print("🧪 Running Reset Password Tests")
-    print("=" * 50)
-    
-    # Run tests with pytest
-    result = pytest.main([
-        str(Path(__file__)),
-        "-v",
-        "--tb=short"
-    ])
-    
-    print("\n" + "=" * 50)
-    if result == 0:
-        print("✅ All reset password tests passed!")
-    else:
-        print("❌ Some reset password tests failed. Check the output above.")
-    
-    return result == 0
+        assert not verify_password(SEED_PASSWORD, updated_user.password_hash)
 
 if __name__ == "__main__":
-    success = run_reset_password_tests()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "--tb=short", "-x"]))
@@ -4,14 +4,12 @@ from app.main import app
 from app.core.database import get_db
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.models.base import Base
-import tempfile
-import os
-import time
 
-# Use a temporary SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///" + tempfile.mkstemp()[1]
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Use an in-memory SQLite database for testing; StaticPool shares its single connection
+SQLALCHEMY_DATABASE_URL = "sqlite+pysqlite:///:memory:"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Override the get_db dependency
@@ -21,13 +19,6 @@ def setup_and_teardown():
     yield
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
-    db_path = SQLALCHEMY_DATABASE_URL.replace("sqlite:///", "")
-    for _ in range(5):
-        try:
-            os.remove(db_path)
-            break
-        except PermissionError:
-            time.sleep(0.2)
 
 @pytest.fixture(scope="module")
 def client():
@@ -37,9 +28,11 @@ def client():
             yield db
         finally:
             db.close()
+    # Install the override here rather than at import so each xdist worker owns its setup
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
         yield c
+    app.dependency_overrides.pop(get_db, None)
 
 
 def test_user_crud_flow(client):
@@ -92,8 +85,9 @@ def test_user_crud_flow(client):
     resp6 = client.get(f"/users/{user_id}")
     assert resp6.status_code == 404
 
-def test_family_group_signup_and_invites(client):
-    # 1. Family group signup with invitees
+@pytest.fixture(scope="module")
+def family_admin(client):
+    """Sign up a family admin with invitees once and return (user_id, family_group_id)"""
     family_data = {
         "username": "familyadmin",
         "first_name": "Family",
@@ -126,8 +120,12 @@ def test_family_group_signup_and_invites(client):
 
     # Ensure the family group is committed and visible
     _ = client.get(f"/users/{user_id}")
+    return user_id, family_group_id
+
+def test_family_group_signup_and_invites(client, family_admin):
+    _, family_group_id = family_admin
 
-    # 2. Check that invitations were created (via /family/invite endpoint or direct DB query)
+    # 1. Check that invitations were created (via /family/invite endpoint or direct DB query)
     new_invite_data = {
         "family_group_id": family_group_id,
         "invitees": [
@@ -145,7 +143,7 @@ def test_family_group_signup_and_invites(client):
     assert any(inv["email"] == "grandparent1@example.com" for inv in invites)
     token = [inv["token"] for inv in invites if inv["email"] == "grandparent1@example.com"][0]
 
-    # 3. Accept an invitation (get invite details for pre-population)
+    # 2. Accept an invitation (get invite details for pre-population)
     resp3 = client.get(f"/family/invite/accept/{token}")
     assert resp3.status_code == 200
     invite_details = resp3.json()
@@ -155,7 +153,7 @@ def test_family_group_signup_and_invites(client):
     assert invite_details["role"] == "grandparent"
     assert invite_details["inviter"] == "Family Admin"
 
-    # 4. Register invitee with username and password
+    # 3. Register invitee with username and password
     register_data = {
         "token": token,
         "username": "grandparentuser",
@@ -168,7 +166,7 @@ def test_family_group_signup_and_invites(client):
     assert new_user["family_group_id"] == family_group_id
     assert new_user["username"] == "grandparentuser"
 
-    # 5. Try to register with the same username (should fail)
+    # 4. Try to register with the same username (should fail)
     register_data2 = {
         "token": token,
         "username": "grandparentuser",
@@ -177,6 +175,6 @@ def test_family_group_signup_and_invites(client):
     resp5 = client.post("/family/register-invitee", json=register_data2)
     assert resp5.status_code == 404 or resp5.status_code == 400
 
-    # 6. Try to accept the same invitation again (should fail)
+    # 5. Try to accept the same invitation again (should fail)
     resp6 = client.get(f"/family/invite/accept/{token}")
     assert resp6.status_code == 404 
\ No newline at end of file
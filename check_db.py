@@ -1,13 +1,12 @@
 import sqlite3
+from contextlib import closing
 
 try:
-    conn = sqlite3.connect('finance.db')
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = cursor.fetchall()
+    # Open read-only so this is safe to run while the app is using the database
+    with closing(sqlite3.connect('file:finance.db?mode=ro', uri=True)) as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
     print("Tables in database:")
     for table in tables:
         print(f"  - {table[0]}")
-    conn.close()
 except Exception as e:
-    print(f"Error: {e}") 
\ No newline at end of file
+    print(f"Error: {e}")
@@ -6,17 +6,58 @@ Download and Setup Redis for Windows
 import os
 import sys
 import subprocess
+import hashlib
 import urllib.request
 import zipfile
 import shutil
 from pathlib import Path
+from setup_redis import test_redis_connection
+
+REDIS_URL = "https://github.com/microsoftarchive/redis/releases/download/win-3.0.504/Redis-x64-3.0.504.zip"
+# The win-3.0.504 release zip never changes, so its SHA256 is pinned here once recorded;
+# REDIS_ZIP_SHA256 overrides it (e.g. for a mirror)
+PINNED_REDIS_ZIP_SHA256 = None
+REDIS_ZIP_SHA256 = os.getenv("REDIS_ZIP_SHA256") or PINNED_REDIS_ZIP_SHA256
+CACHE_DIR = Path.home() / ".cache" / "spendlyzer"
+CHUNK_SIZE = 1 << 18
+
+def sha256_file(path):
+    """Return the hex SHA256 digest of a file"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 def download_file(url, filename):
-    """Download a file with progress"""
+    """Stream a file to disk, keeping the previous copy if the download fails"""
     print(f"📥 Downloading {filename}...")
-    urllib.request.urlretrieve(url, filename)
+    partial = Path(f"{filename}.part")
+    req = urllib.request.Request(url, headers={"User-Agent": "spendlyzer-setup"})
+    with urllib.request.urlopen(req) as r, open(partial, "wb") as f:
+        shutil.copyfileobj(r, f, length=CHUNK_SIZE)
+    partial.replace(filename)
     print(f"✅ Downloaded {filename}")
 
+def fetch_redis_zip():
+    """Return the cached Redis zip, downloading and verifying it on first use"""
+    zip_file = CACHE_DIR / Path(REDIS_URL).name
+    if zip_file.exists():
+        print(f"✅ Using cached {zip_file}")
+    else:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        download_file(REDIS_URL, zip_file)
+
+    digest = sha256_file(zip_file)
+    if not REDIS_ZIP_SHA256:
+        print(f"⚠️  SHA256 not verified, no expected digest: {digest}")
+        return zip_file
+    if digest != REDIS_ZIP_SHA256.lower():
+        zip_file.unlink()
+        raise ValueError(f"SHA256 mismatch for {zip_file.name}: got {digest}")
+    print(f"🔒 SHA256 verified: {digest}")
+    return zip_file
+
 def extract_zip(zip_path, extract_to):
     """Extract zip file"""
     print(f"📦 Extracting {zip_path}...")
@@ -35,17 +76,11 @@ def setup_redis_windows():
     # Create Redis directory
     redis_dir.mkdir(exist_ok=True)
     
-    # Download Redis for Windows
-    redis_url = "https://github.com/microsoftarchive/redis/releases/download/win-3.0.504/Redis-x64-3.0.504.zip"
-    zip_file = "redis-windows.zip"
-    
+    # Download Redis for Windows (the zip is kept in the cache for later runs)
     try:
-        download_file(redis_url, zip_file)
+        zip_file = fetch_redis_zip()
         extract_zip(zip_file, redis_dir)
         
-        # Clean up zip file
-        os.remove(zip_file)
-        
         print("✅ Redis for Windows downloaded and extracted")
         return redis_dir
         
@@ -87,16 +122,6 @@ def start_redis_server(redis_dir):
         print(f"❌ Error starting Redis: {e}")
         return False
 
-def test_redis_connection():
-    """Test Redis connection"""
-    try:
-        import redis
-        r = redis.Redis(host='localhost', port=6379, db=0, socket_connect_timeout=5)
-        r.ping()
-        return True
-    except:
-        return False
-
 def main():
     print("🚀 Redis Setup for Windows")
     print("=" * 40)
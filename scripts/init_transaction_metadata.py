@@ -9,14 +9,32 @@ This script inserts all required metadata for the transaction system:
 
 Usage:
     python scripts/init_transaction_metadata.py
+    python scripts/init_transaction_metadata.py --verbose  # also list every row (or INIT_VERBOSE=1)
 
 This script is idempotent and can be run multiple times safely.
 """
 import os
 import sys
 import asyncio
+import argparse
 from pathlib import Path
 
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Insert the transaction metadata rows. Safe to run repeatedly."
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="list every row that is added or already present (same as INIT_VERBOSE=1)"
+    )
+    return parser.parse_args(argv)
+
+
+# Parse arguments before the SQLAlchemy and model imports below, so --help returns immediately
+ARGS = parse_args() if __name__ == "__main__" else None
+
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -32,7 +50,9 @@ if env_path.exists():
     load_dotenv(dotenv_path=env_path)
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import select, func
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.pool import NullPool, StaticPool
 
 # Import models
 from app.models import (
@@ -41,6 +61,9 @@ from app.models import (
 )
 from app.models.base import Base
 
+# Per-row output is off by default; the section results and the summary always print
+VERBOSE = bool(ARGS and ARGS.verbose) or bool(int(os.getenv("INIT_VERBOSE", "0")))
+
 DATABASE_URL = os.getenv("DB_URL")
 if not DATABASE_URL:
     raise RuntimeError("DB_URL environment variable must be set")
@@ -51,498 +74,512 @@ if DATABASE_URL.startswith('sqlite+aiosqlite:///'):
     if db_path.startswith('./') or db_path.startswith('../'):
         DATABASE_URL = f'sqlite+aiosqlite:///{project_root}/finance.db'
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+# A one-shot script needs no pool: SQLite reuses its single connection, other databases connect on demand
+IS_SQLITE = DATABASE_URL.startswith('sqlite')
+engine = create_async_engine(
+    DATABASE_URL,
+    insertmanyvalues_page_size=1000,
+    poolclass=StaticPool if IS_SQLITE else NullPool,
+)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+# Dialects that support INSERT ... ON CONFLICT DO NOTHING ... RETURNING
+CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Seed data, built once at import
+TRANSACTION_TYPE_ROWS = (
+    {
+        "name": "Expense",
+        "description": "Spending or expense transactions",
+        "icon": "shopping-bag",
+        "color": "text-red-600",
+        "is_active": True
+    },
+    {
+        "name": "Income",
+        "description": "Income or earnings transactions",
+        "icon": "trending-up",
+        "color": "text-green-600",
+        "is_active": True
+    },
+    {
+        "name": "Transfer",
+        "description": "Transfers between accounts",
+        "icon": "arrow-right",
+        "color": "text-blue-600",
+        "is_active": True
+    },
+    {
+        "name": "Cash",
+        "description": "Cash withdrawal or deposit",
+        "icon": "wallet",
+        "color": "text-yellow-600",
+        "is_active": True
+    },
+    {
+        "name": "Check Withdrawn",
+        "description": "Check withdrawal",
+        "icon": "check",
+        "color": "text-purple-600",
+        "is_active": True
+    },
+    {
+        "name": "Wire",
+        "description": "Wire transfer",
+        "icon": "send",
+        "color": "text-indigo-600",
+        "is_active": True
+    },
+)
+
+EXPENSE_CATEGORY_ROWS = (
+    {
+        "name": "Food & Dining",
+        "description": "Groceries, restaurants, food delivery",
+        "icon": "fork-and-knife",
+        "color": "text-orange-600",
+        "bg_color": "bg-orange-100",
+        "display_order": 1,
+        "is_active": True
+    },
+    {
+        "name": "Transportation",
+        "description": "Gas, public transit, Uber, car payments",
+        "icon": "car",
+        "color": "text-blue-600",
+        "bg_color": "bg-blue-100",
+        "display_order": 2,
+        "is_active": True
+    },
+    {
+        "name": "Shopping",
+        "description": "Clothing, electronics, home goods",
+        "icon": "shopping-bag",
+        "color": "text-purple-600",
+        "bg_color": "bg-purple-100",
+        "display_order": 3,
+        "is_active": True
+    },
+    {
+        "name": "Entertainment",
+        "description": "Movies, games, hobbies, subscriptions",
+        "icon": "film",
+        "color": "text-pink-600",
+        "bg_color": "bg-pink-100",
+        "display_order": 4,
+        "is_active": True
+    },
+    {
+        "name": "Healthcare",
+        "description": "Medical, dental, pharmacy, health products",
+        "icon": "heart",
+        "color": "text-red-600",
+        "bg_color": "bg-red-100",
+        "display_order": 5,
+        "is_active": True
+    },
+    {
+        "name": "Utilities",
+        "description": "Electricity, water, internet, gas bills",
+        "icon": "zap",
+        "color": "text-yellow-600",
+        "bg_color": "bg-yellow-100",
+        "display_order": 6,
+        "is_active": True
+    },
+    {
+        "name": "Housing",
+        "description": "Rent, mortgage, property tax, maintenance",
+        "icon": "home",
+        "color": "text-cyan-600",
+        "bg_color": "bg-cyan-100",
+        "display_order": 7,
+        "is_active": True
+    },
+    {
+        "name": "Insurance",
+        "description": "Auto, health, home, life insurance",
+        "icon": "shield",
+        "color": "text-green-600",
+        "bg_color": "bg-green-100",
+        "display_order": 8,
+        "is_active": True
+    },
+    {
+        "name": "Personal Care",
+        "description": "Haircut, spa, gym, fitness",
+        "icon": "scissors",
+        "color": "text-indigo-600",
+        "bg_color": "bg-indigo-100",
+        "display_order": 9,
+        "is_active": True
+    },
+    {
+        "name": "Education",
+        "description": "Tuition, books, courses, training",
+        "icon": "book",
+        "color": "text-teal-600",
+        "bg_color": "bg-teal-100",
+        "display_order": 10,
+        "is_active": True
+    },
+    {
+        "name": "Miscellaneous",
+        "description": "Other expenses",
+        "icon": "square",
+        "color": "text-gray-600",
+        "bg_color": "bg-gray-100",
+        "display_order": 11,
+        "is_active": True
+    },
+)
+
+EXPENSE_SUBCATEGORY_ROWS = (
+    # Food & Dining
+    ("Food & Dining", [
+        ("Groceries", "grocery-store"),
+        ("Restaurants", "utensils"),
+        ("Fast Food", "zap"),
+        ("Coffee & Drinks", "coffee"),
+        ("Delivery", "truck"),
+    ]),
+    # Transportation
+    ("Transportation", [
+        ("Gas", "fuel"),
+        ("Public Transit", "train"),
+        ("Uber/Lyft", "users"),
+        ("Taxi", "navigation"),
+        ("Car Payment", "credit-card"),
+        ("Car Insurance", "shield"),
+        ("Parking", "map-pin"),
+    ]),
+    # Shopping
+    ("Shopping", [
+        ("Clothing", "shirt"),
+        ("Electronics", "monitor"),
+        ("Home & Garden", "home"),
+        ("Books", "book"),
+        ("Furniture", "inbox"),
+    ]),
+    # Entertainment
+    ("Entertainment", [
+        ("Movies", "film"),
+        ("Streaming Services", "tv"),
+        ("Games", "gamepad2"),
+        ("Concerts/Events", "music"),
+        ("Hobbies", "palette"),
+    ]),
+    # Healthcare
+    ("Healthcare", [
+        ("Doctor Visit", "user-md"),
+        ("Medication", "pill"),
+        ("Dental", "tooth"),
+        ("Gym/Fitness", "activity"),
+        ("Mental Health", "smile"),
+    ]),
+    # Utilities
+    ("Utilities", [
+        ("Electricity", "zap"),
+        ("Water", "droplet"),
+        ("Internet", "wifi"),
+        ("Gas", "flame"),
+        ("Phone", "smartphone"),
+    ]),
+    # Housing
+    ("Housing", [
+        ("Rent", "key"),
+        ("Mortgage", "home"),
+        ("Property Tax", "receipt"),
+        ("Maintenance", "wrench"),
+        ("Home Improvement", "hammer"),
+    ]),
+    # Insurance
+    ("Insurance", [
+        ("Auto Insurance", "shield"),
+        ("Health Insurance", "heart"),
+        ("Home Insurance", "home"),
+        ("Life Insurance", "umbrella"),
+    ]),
+    # Personal Care
+    ("Personal Care", [
+        ("Haircut", "scissors"),
+        ("Spa", "droplet"),
+        ("Gym Membership", "activity"),
+        ("Beauty Products", "mirror"),
+    ]),
+    # Education
+    ("Education", [
+        ("Tuition", "book"),
+        ("Books & Materials", "library"),
+        ("Courses", "graduation-cap"),
+        ("Training", "zap"),
+    ]),
+)
+
+PAYMENT_METHOD_ROWS = (
+    {
+        "name": "Credit Card",
+        "description": "Credit card payment",
+        "icon": "credit-card",
+        "color": "text-blue-600",
+        "display_order": 1,
+        "is_active": True
+    },
+    {
+        "name": "Debit Card",
+        "description": "Debit card payment",
+        "icon": "credit-card",
+        "color": "text-green-600",
+        "display_order": 2,
+        "is_active": True
+    },
+    {
+        "name": "Cash",
+        "description": "Cash payment",
+        "icon": "wallet",
+        "color": "text-yellow-600",
+        "display_order": 3,
+        "is_active": True
+    },
+    {
+        "name": "Check",
+        "description": "Check payment",
+        "icon": "check",
+        "color": "text-purple-600",
+        "display_order": 4,
+        "is_active": True
+    },
+    {
+        "name": "Bank Transfer",
+        "description": "ACH/Bank transfer",
+        "icon": "arrow-right",
+        "color": "text-indigo-600",
+        "display_order": 5,
+        "is_active": True
+    },
+    {
+        "name": "Wire Transfer",
+        "description": "Wire transfer",
+        "icon": "send",
+        "color": "text-red-600",
+        "display_order": 6,
+        "is_active": True
+    },
+    {
+        "name": "Mobile Payment",
+        "description": "Mobile payment (Venmo, PayPal, etc.)",
+        "icon": "smartphone",
+        "color": "text-cyan-600",
+        "display_order": 7,
+        "is_active": True
+    },
+)
+
+BUDGET_TYPE_ROWS = (
+    {
+        "name": "Essential",
+        "description": "Necessary expenses (food, rent, utilities)",
+        "icon": "alert-circle",
+        "color": "text-red-600",
+        "display_order": 1,
+        "is_active": True
+    },
+    {
+        "name": "Discretionary",
+        "description": "Optional spending (entertainment, shopping)",
+        "icon": "smile",
+        "color": "text-green-600",
+        "display_order": 2,
+        "is_active": True
+    },
+    {
+        "name": "Investment",
+        "description": "Money saved or invested for future",
+        "icon": "trending-up",
+        "color": "text-blue-600",
+        "display_order": 3,
+        "is_active": True
+    },
+    {
+        "name": "Emergency",
+        "description": "Unexpected or emergency expenses",
+        "icon": "alert-triangle",
+        "color": "text-orange-600",
+        "display_order": 4,
+        "is_active": True
+    },
+)
+
 
 async def check_table_exists(session: AsyncSession, table_name: str) -> bool:
     """Check if a table exists in the database"""
-    try:
-        await session.execute(select(func.count(1)).select_from(table_name))
-        return True
-    except Exception:
-        return False
+    conn = await session.connection()
+    return await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(table_name))
+
+
+async def insert_rows(session: AsyncSession, model, rows: list[dict]) -> None:
+    """Bulk insert rows already known to be missing, over COPY when the driver is asyncpg"""
+    if session.bind.dialect.driver == "asyncpg":
+        columns = list(rows[0])
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(row[c] for c in columns) for row in rows],
+            columns=columns,
+        )
+    else:
+        # ORM bulk INSERT from plain mappings: no instances are built and rows are batched by insertmanyvalues
+        await session.execute(insert(model), rows)
+
+
+async def bulk_seed(session: AsyncSession, model, rows, label: str, key: str = "name") -> int:
+    """Insert the rows whose key is not in the table yet, skipping the rest"""
+    table = model.__table__
+    column = table.c[key]
+    dialect_insert = CONFLICT_INSERTS.get(session.bind.dialect.name)
+    if dialect_insert is not None:
+        # The unique index on key rejects existing rows; RETURNING reports which ones went in
+        stmt = dialect_insert(table).values(list(rows)).on_conflict_do_nothing(index_elements=[key]).returning(column)
+        inserted = set((await session.execute(stmt)).scalars().all())
+    else:
+        result = await session.execute(select(column).where(column.in_([row[key] for row in rows])))
+        existing = set(result.scalars().all())
+        if len(existing) == len(rows) and not VERBOSE:
+            # Everything is already seeded (the usual rerun): nothing to diff, insert or report
+            return 0
+        new_rows = [row for row in rows if row[key] not in existing]
+        if new_rows:
+            await insert_rows(session, model, new_rows)
+        inserted = {row[key] for row in new_rows}
+
+    if VERBOSE:
+        # One write for the whole table instead of a print per row
+        out = []
+        for row in rows:
+            if row[key] in inserted:
+                out.append(f"  ✓ Added {label}: {row[key]}\n")
+            else:
+                out.append(f"  ⊘ {label.capitalize()} already exists: {row[key]}\n")
+        sys.stdout.write("".join(out))
+    return len(inserted)
 
 
 async def insert_transaction_types(session: AsyncSession) -> int:
     """Insert transaction types"""
-    transaction_types = [
-        TransactionType(
-            name="Expense",
-            description="Spending or expense transactions",
-            icon="shopping-bag",
-            color="text-red-600",
-            is_active=True
-        ),
-        TransactionType(
-            name="Income",
-            description="Income or earnings transactions",
-            icon="trending-up",
-            color="text-green-600",
-            is_active=True
-        ),
-        TransactionType(
-            name="Transfer",
-            description="Transfers between accounts",
-            icon="arrow-right",
-            color="text-blue-600",
-            is_active=True
-        ),
-        TransactionType(
-            name="Cash",
-            description="Cash withdrawal or deposit",
-            icon="wallet",
-            color="text-yellow-600",
-            is_active=True
-        ),
-        TransactionType(
-            name="Check Withdrawn",
-            description="Check withdrawal",
-            icon="check",
-            color="text-purple-600",
-            is_active=True
-        ),
-        TransactionType(
-            name="Wire",
-            description="Wire transfer",
-            icon="send",
-            color="text-indigo-600",
-            is_active=True
-        ),
-    ]
-
-    count = 0
-    for t_type in transaction_types:
-        # Check if already exists
-        result = await session.execute(
-            select(TransactionType).where(TransactionType.name == t_type.name)
-        )
-        if not result.scalars().first():
-            session.add(t_type)
-            count += 1
-            print(f"  ✓ Added transaction type: {t_type.name}")
-        else:
-            print(f"  ⊘ Transaction type already exists: {t_type.name}")
-
-    if count > 0:
-        await session.commit()
-    return count
+    return await bulk_seed(session, TransactionType, TRANSACTION_TYPE_ROWS, "transaction type")
 
 
 async def insert_expense_categories(session: AsyncSession) -> int:
     """Insert expense categories"""
-    categories = [
-        ExpenseCategory(
-            name="Food & Dining",
-            description="Groceries, restaurants, food delivery",
-            icon="fork-and-knife",
-            color="text-orange-600",
-            bg_color="bg-orange-100",
-            display_order=1,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Transportation",
-            description="Gas, public transit, Uber, car payments",
-            icon="car",
-            color="text-blue-600",
-            bg_color="bg-blue-100",
-            display_order=2,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Shopping",
-            description="Clothing, electronics, home goods",
-            icon="shopping-bag",
-            color="text-purple-600",
-            bg_color="bg-purple-100",
-            display_order=3,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Entertainment",
-            description="Movies, games, hobbies, subscriptions",
-            icon="film",
-            color="text-pink-600",
-            bg_color="bg-pink-100",
-            display_order=4,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Healthcare",
-            description="Medical, dental, pharmacy, health products",
-            icon="heart",
-            color="text-red-600",
-            bg_color="bg-red-100",
-            display_order=5,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Utilities",
-            description="Electricity, water, internet, gas bills",
-            icon="zap",
-            color="text-yellow-600",
-            bg_color="bg-yellow-100",
-            display_order=6,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Housing",
-            description="Rent, mortgage, property tax, maintenance",
-            icon="home",
-            color="text-cyan-600",
-            bg_color="bg-cyan-100",
-            display_order=7,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Insurance",
-            description="Auto, health, home, life insurance",
-            icon="shield",
-            color="text-green-600",
-            bg_color="bg-green-100",
-            display_order=8,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Personal Care",
-            description="Haircut, spa, gym, fitness",
-            icon="scissors",
-            color="text-indigo-600",
-            bg_color="bg-indigo-100",
-            display_order=9,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Education",
-            description="Tuition, books, courses, training",
-            icon="book",
-            color="text-teal-600",
-            bg_color="bg-teal-100",
-            display_order=10,
-            is_active=True
-        ),
-        ExpenseCategory(
-            name="Miscellaneous",
-            description="Other expenses",
-            icon="square",
-            color="text-gray-600",
-            bg_color="bg-gray-100",
-            display_order=11,
-            is_active=True
-        ),
-    ]
-
-    count = 0
-    for category in categories:
-        result = await session.execute(
-            select(ExpenseCategory).where(ExpenseCategory.name == category.name)
-        )
-        if not result.scalars().first():
-            session.add(category)
-            count += 1
-            print(f"  ✓ Added expense category: {category.name}")
-        else:
-            print(f"  ⊘ Category already exists: {category.name}")
-
-    if count > 0:
-        await session.commit()
-    return count
+    return await bulk_seed(session, ExpenseCategory, EXPENSE_CATEGORY_ROWS, "expense category")
 
 
 async def insert_expense_subcategories(session: AsyncSession) -> int:
     """Insert expense subcategories"""
-    subcategories_data = [
-        # Food & Dining
-        ("Food & Dining", [
-            ("Groceries", "grocery-store"),
-            ("Restaurants", "utensils"),
-            ("Fast Food", "zap"),
-            ("Coffee & Drinks", "coffee"),
-            ("Delivery", "truck"),
-        ]),
-        # Transportation
-        ("Transportation", [
-            ("Gas", "fuel"),
-            ("Public Transit", "train"),
-            ("Uber/Lyft", "users"),
-            ("Taxi", "navigation"),
-            ("Car Payment", "credit-card"),
-            ("Car Insurance", "shield"),
-            ("Parking", "map-pin"),
-        ]),
-        # Shopping
-        ("Shopping", [
-            ("Clothing", "shirt"),
-            ("Electronics", "monitor"),
-            ("Home & Garden", "home"),
-            ("Books", "book"),
-            ("Furniture", "inbox"),
-        ]),
-        # Entertainment
-        ("Entertainment", [
-            ("Movies", "film"),
-            ("Streaming Services", "tv"),
-            ("Games", "gamepad2"),
-            ("Concerts/Events", "music"),
-            ("Hobbies", "palette"),
-        ]),
-        # Healthcare
-        ("Healthcare", [
-            ("Doctor Visit", "user-md"),
-            ("Medication", "pill"),
-            ("Dental", "tooth"),
-            ("Gym/Fitness", "activity"),
-            ("Mental Health", "smile"),
-        ]),
-        # Utilities
-        ("Utilities", [
-            ("Electricity", "zap"),
-            ("Water", "droplet"),
-            ("Internet", "wifi"),
-            ("Gas", "flame"),
-            ("Phone", "smartphone"),
-        ]),
-        # Housing
-        ("Housing", [
-            ("Rent", "key"),
-            ("Mortgage", "home"),
-            ("Property Tax", "receipt"),
-            ("Maintenance", "wrench"),
-            ("Home Improvement", "hammer"),
-        ]),
-        # Insurance
-        ("Insurance", [
-            ("Auto Insurance", "shield"),
-            ("Health Insurance", "heart"),
-            ("Home Insurance", "home"),
-            ("Life Insurance", "umbrella"),
-        ]),
-        # Personal Care
-        ("Personal Care", [
-            ("Haircut", "scissors"),
-            ("Spa", "droplet"),
-            ("Gym Membership", "activity"),
-            ("Beauty Products", "mirror"),
-        ]),
-        # Education
-        ("Education", [
-            ("Tuition", "book"),
-            ("Books & Materials", "library"),
-            ("Courses", "graduation-cap"),
-            ("Training", "zap"),
-        ]),
-    ]
-
-    count = 0
-    for cat_name, subcats in subcategories_data:
-        # Get category
-        cat_result = await session.execute(
-            select(ExpenseCategory).where(ExpenseCategory.name == cat_name)
-        )
-        category = cat_result.scalars().first()
-        if not category:
-            print(f"  ⚠ Category not found: {cat_name}")
+    # Only the ids are needed, so map names to ids without loading full category objects
+    cat_rows = (await session.execute(select(ExpenseCategory.id, ExpenseCategory.name))).all()
+    cat_id_by_name = {name: cid for cid, name in cat_rows}
+    # Every existing (category id, name) pair in one query, checked in memory below
+    existing = frozenset((await session.execute(
+        select(ExpenseSubcategory.expense_category_id, ExpenseSubcategory.name)
+    )).tuples())
+
+    new_rows = []
+    out = []
+    for cat_name, subcats in EXPENSE_SUBCATEGORY_ROWS:
+        category_id = cat_id_by_name.get(cat_name)
+        if category_id is None:
+            out.append(f"  ⚠ Category not found: {cat_name}\n")
             continue
 
         for subcat_name, icon in subcats:
-            result = await session.execute(
-                select(ExpenseSubcategory).where(
-                    (ExpenseSubcategory.name == subcat_name) &
-                    (ExpenseSubcategory.expense_category_id == category.id)
-                )
-            )
-            if not result.scalars().first():
-                subcat = ExpenseSubcategory(
-                    name=subcat_name,
-                    expense_category_id=category.id,
-                    icon=icon,
-                    is_active=True,
-                    display_order=0
-                )
-                session.add(subcat)
-                count += 1
-                print(f"  ✓ Added subcategory: {cat_name} → {subcat_name}")
-            else:
-                print(f"  ⊘ Subcategory already exists: {cat_name} → {subcat_name}")
-
-    if count > 0:
-        await session.commit()
-    return count
+            if (category_id, subcat_name) not in existing:
+                new_rows.append({
+                    "name": subcat_name,
+                    "expense_category_id": category_id,
+                    "icon": icon,
+                    "is_active": True,
+                    "display_order": 0
+                })
+                if VERBOSE:
+                    out.append(f"  ✓ Added subcategory: {cat_name} → {subcat_name}\n")
+            elif VERBOSE:
+                out.append(f"  ⊘ Subcategory already exists: {cat_name} → {subcat_name}\n")
+    sys.stdout.write("".join(out))
+
+    if new_rows:
+        await insert_rows(session, ExpenseSubcategory, new_rows)
+    return len(new_rows)
 
 
 async def insert_payment_methods(session: AsyncSession) -> int:
     """Insert payment methods"""
-    payment_methods = [
-        PaymentMethod(
-            name="Credit Card",
-            description="Credit card payment",
-            icon="credit-card",
-            color="text-blue-600",
-            display_order=1,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Debit Card",
-            description="Debit card payment",
-            icon="credit-card",
-            color="text-green-600",
-            display_order=2,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Cash",
-            description="Cash payment",
-            icon="wallet",
-            color="text-yellow-600",
-            display_order=3,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Check",
-            description="Check payment",
-            icon="check",
-            color="text-purple-600",
-            display_order=4,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Bank Transfer",
-            description="ACH/Bank transfer",
-            icon="arrow-right",
-            color="text-indigo-600",
-            display_order=5,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Wire Transfer",
-            description="Wire transfer",
-            icon="send",
-            color="text-red-600",
-            display_order=6,
-            is_active=True
-        ),
-        PaymentMethod(
-            name="Mobile Payment",
-            description="Mobile payment (Venmo, PayPal, etc.)",
-            icon="smartphone",
-            color="text-cyan-600",
-            display_order=7,
-            is_active=True
-        ),
-    ]
-
-    count = 0
-    for method in payment_methods:
-        result = await session.execute(
-            select(PaymentMethod).where(PaymentMethod.name == method.name)
-        )
-        if not result.scalars().first():
-            session.add(method)
-            count += 1
-            print(f"  ✓ Added payment method: {method.name}")
-        else:
-            print(f"  ⊘ Payment method already exists: {method.name}")
-
-    if count > 0:
-        await session.commit()
-    return count
+    return await bulk_seed(session, PaymentMethod, PAYMENT_METHOD_ROWS, "payment method")
 
 
 async def insert_budget_types(session: AsyncSession) -> int:
     """Insert budget types"""
-    budget_types = [
-        BudgetType(
-            name="Essential",
-            description="Necessary expenses (food, rent, utilities)",
-            icon="alert-circle",
-            color="text-red-600",
-            display_order=1,
-            is_active=True
-        ),
-        BudgetType(
-            name="Discretionary",
-            description="Optional spending (entertainment, shopping)",
-            icon="smile",
-            color="text-green-600",
-            display_order=2,
-            is_active=True
-        ),
-        BudgetType(
-            name="Investment",
-            description="Money saved or invested for future",
-            icon="trending-up",
-            color="text-blue-600",
-            display_order=3,
-            is_active=True
-        ),
-        BudgetType(
-            name="Emergency",
-            description="Unexpected or emergency expenses",
-            icon="alert-triangle",
-            color="text-orange-600",
-            display_order=4,
-            is_active=True
-        ),
-    ]
-
-    count = 0
-    for btype in budget_types:
-        result = await session.execute(
-            select(BudgetType).where(BudgetType.name == btype.name)
-        )
-        if not result.scalars().first():
-            session.add(btype)
-            count += 1
-            print(f"  ✓ Added budget type: {btype.name}")
-        else:
-            print(f"  ⊘ Budget type already exists: {btype.name}")
+    return await bulk_seed(session, BudgetType, BUDGET_TYPE_ROWS, "budget type")
 
-    if count > 0:
-        await session.commit()
-    return count
+
+async def seed_in_own_session(inserter) -> int:
+    """Run one inserter in its own session and transaction"""
+    async with AsyncSessionLocal() as session, session.begin():
+        return await inserter(session)
 
 
 async def main():
     """Main function to initialize all metadata"""
-    print("\n" + "="*70)
-    print("Transaction Metadata Initialization Script")
-    print("="*70 + "\n")
-
-    async with engine.begin() as conn:
-        # Create all tables first
-        await conn.run_sync(Base.metadata.create_all)
-        print("✓ Database tables created/verified\n")
-
-    async with AsyncSessionLocal() as session:
-        print("Initializing metadata...\n")
-
-        print("1. Inserting Transaction Types...")
-        count1 = await insert_transaction_types(session)
-        print(f"   Result: {count1} new types added\n")
+    try:
+        print("\n" + "="*70)
+        print("Transaction Metadata Initialization Script")
+        print("="*70 + "\n")
 
-        print("2. Inserting Expense Categories...")
-        count2 = await insert_expense_categories(session)
-        print(f"   Result: {count2} new categories added\n")
+        async with engine.begin() as conn:
+            if IS_SQLITE:
+                # Connection-level write settings; StaticPool keeps them for the seeding session too
+                await conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+                await conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
+                await conn.exec_driver_sql("PRAGMA cache_size=-64000")
 
-        print("3. Inserting Expense Subcategories...")
-        count3 = await insert_expense_subcategories(session)
-        print(f"   Result: {count3} new subcategories added\n")
+            # Create all tables first
+            await conn.run_sync(Base.metadata.create_all)
+            print("✓ Database tables created/verified\n")
 
-        print("4. Inserting Payment Methods...")
-        count4 = await insert_payment_methods(session)
-        print(f"   Result: {count4} new payment methods added\n")
+        print("Initializing metadata...\n")
+        if IS_SQLITE:
+            # SQLite has a single writer: seed sequentially in one transaction, committed once at the end
+            async with AsyncSessionLocal() as session, session.begin():
+                count1 = await insert_transaction_types(session)
+                count2 = await insert_expense_categories(session)
+                count3 = await insert_expense_subcategories(session)
+                count4 = await insert_payment_methods(session)
+                count5 = await insert_budget_types(session)
+        else:
+            # These tables are independent, so seed them concurrently on separate connections;
+            # subcategories need the categories committed first
+            count1, count2, count4, count5 = await asyncio.gather(
+                seed_in_own_session(insert_transaction_types),
+                seed_in_own_session(insert_expense_categories),
+                seed_in_own_session(insert_payment_methods),
+                seed_in_own_session(insert_budget_types),
+            )
+            count3 = await seed_in_own_session(insert_expense_subcategories)
 
-        print("5. Inserting Budget Types...")
-        count5 = await insert_budget_types(session)
-        print(f"   Result: {count5} new budget types added\n")
+        print(f"1. Transaction Types: {count1} new types added")
+        print(f"2. Expense Categories: {count2} new categories added")
+        print(f"3. Expense Subcategories: {count3} new subcategories added")
+        print(f"4. Payment Methods: {count4} new payment methods added")
+        print(f"5. Budget Types: {count5} new budget types added\n")
 
         total = count1 + count2 + count3 + count4 + count5
         print("="*70)
         print(f"✓ Initialization complete! Total new records: {total}")
         print("="*70 + "\n")
-
-    await engine.dispose()
+    finally:
+        # Close the pooled connection even on failure; StaticPool's aiosqlite thread would keep the process alive
+        await engine.dispose()
 
 
 if __name__ == "__main__":